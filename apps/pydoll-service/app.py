@@ -5,44 +5,97 @@ Provides the same API interface as the original puppeteer-service-ts.
 """
 
 import asyncio
-import base64
 import json
 import logging
 import os
 import time
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
 
+import orjson
 import Xlib.display
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, HttpUrl
+import pydoll.connection.connection_handler as cdp_connection
 from pydoll.browser.chromium.chrome import Chrome
 from pydoll.browser.options import ChromiumOptions
-from pydoll.exceptions import PageLoadTimeout
+from pydoll.exceptions import PageLoadTimeout, WaitTimeout
 from pyvirtualdisplay import Display
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize virtual display for Linux container environment
-try:
-    display = Xlib.display.Display()
-    screen = display.screen()
-    screen_width = min(screen.width_in_pixels - 150, 1920)
-    screen_height = min(screen.height_in_pixels - 150, 1080)
-except Exception:
-    # Fallback values if X11 display detection fails
-    screen_width = 1920
-    screen_height = 1080
-
-# Start virtual display for screenshot support
-virtual_display = Display(
-    visible=False,  # Set to True for debugging
-    size=(screen_width, screen_height)
-)
-virtual_display.start()
-logger.info(f"Virtual display started with size {screen_width}x{screen_height}")
+
+class OrjsonCodec:
+    """Drop-in for the ``json`` module functions pydoll uses on CDP messages."""
+
+    JSONDecodeError = json.JSONDecodeError
+
+    @staticmethod
+    def loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogate escapes, which Chrome emits for
+            # broken text in the DOM; stdlib json accepts them
+            return json.loads(data)
+
+    @staticmethod
+    def dumps(obj) -> str:
+        # CDP needs text frames, so hand back str rather than bytes
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # Lone surrogates decoded above cannot be encoded as UTF-8;
+            # stdlib json escapes them instead
+            return json.dumps(obj)
+
+
+# Every CDP message, including multi-MB page sources and screenshots, is
+# decoded by pydoll's connection handler; use orjson instead of stdlib json
+if getattr(cdp_connection, "json", None) is json:
+    cdp_connection.json = OrjsonCodec
+else:
+    logger.warning("pydoll connection handler no longer uses json; CDP messages stay on its own decoder")
+
+# Screen size and virtual display are set up in startup_event so that
+# importing the app (once per uvicorn worker) does not block on X11
+screen_width = 1920
+screen_height = 1080
+virtual_display = None
+
+
+def start_virtual_display():
+    """Detect the screen size and start the virtual display for screenshots."""
+    global screen_width, screen_height, virtual_display
+    
+    # Initialize virtual display for Linux container environment
+    try:
+        display = Xlib.display.Display()
+        screen = display.screen()
+        screen_width = min(screen.width_in_pixels - 150, 1920)
+        screen_height = min(screen.height_in_pixels - 150, 1080)
+        display.close()
+    except Exception:
+        # Fallback values if X11 display detection fails
+        screen_width = 1920
+        screen_height = 1080
+    
+    # Start virtual display for screenshot support
+    try:
+        virtual_display = Display(
+            visible=False,  # Set to True for debugging
+            size=(screen_width, screen_height)
+        )
+        virtual_display.start()
+        logger.info(f"Virtual display started with size {screen_width}x{screen_height}")
+    except Exception as e:
+        virtual_display = None
+        logger.warning(f"Failed to start virtual display: {e}")
+
 
 app = FastAPI(
     title="Pydoll Scraping Service",
@@ -67,6 +120,7 @@ class ScrapeRequest(BaseModel):
     check_selector: Optional[str] = None
     screenshot: Optional[bool] = False
     full_page_screenshot: Optional[bool] = False
+    warm_origins: Optional[List[HttpUrl]] = None
 
 
 class ScrapeResponse(BaseModel):
@@ -74,6 +128,15 @@ class ScrapeResponse(BaseModel):
     pageStatusCode: Optional[int] = None
     pageError: Optional[str] = None
     screenshot: Optional[str] = None
+    screenshotFormat: Optional[str] = None
+
+
+class BatchScrapeRequest(BaseModel):
+    items: List[ScrapeRequest]
+
+
+class BatchScrapeResponse(BaseModel):
+    results: List[ScrapeResponse]
 
 
 def create_browser():
@@ -97,7 +160,473 @@ def create_browser():
     return Chrome(options=options)
 
 
-# Remove the global browser manager line since we deleted the class
+class PooledBrowser:
+    """A pooled Chrome instance with its reusable tab and usage counters."""
+
+    def __init__(self, browser: Optional[Chrome] = None):
+        self.browser = browser
+        self.use_count = 0
+        self.tab = None
+        self.context_id = None
+        self.tab_use_count = 0
+        self.resources_blocked = False
+        # Origins the tab has requested since its last reset
+        self.origins = set()
+
+
+def url_origin(url: str) -> Optional[str]:
+    """Return the scheme://host[:port] origin of an http(s) URL."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return None
+    return f"{parts.scheme}://{parts.netloc.rsplit('@', 1)[-1]}"
+
+
+class BrowserPool:
+    """
+    Fixed-size pool of pre-started Chrome instances shared across requests.
+
+    Browsers are checked out with ``acquire`` and handed back with ``release``.
+    A browser is stopped once it has served ``recycle_after`` requests and its
+    slot is relaunched on the next checkout, which keeps native memory from
+    drifting in long-running containers.
+
+    Each browser serves one request at a time through a single tab kept open
+    in its own browser context. After a request has been answered the tab is
+    sent back to ``about:blank`` in the background, the context's cookies are
+    deleted and storage (including service workers) is cleared for every
+    origin the tab requested, iframes, redirects and third parties included.
+    The slot is only handed out again once that is done. After
+    ``recycle_tab_after`` requests the whole context is replaced.
+    """
+
+    def __init__(self, size: int, recycle_after: int, recycle_tab_after: int):
+        self.size = size
+        self.recycle_after = recycle_after
+        self.recycle_tab_after = recycle_tab_after
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._slots = []
+        self._recycle_tasks = set()
+
+    async def _launch(self, pooled: PooledBrowser):
+        browser = create_browser()
+        try:
+            await browser.start()
+        except Exception:
+            try:
+                await browser.stop()
+            except Exception:
+                pass
+            raise
+        
+        # Set browser window bounds for consistent screenshots
+        try:
+            await browser.set_window_bounds({
+                'left': 0,
+                'top': 0,
+                'width': screen_width,
+                'height': screen_height
+            })
+        except Exception as e:
+            logger.warning(f"Failed to set window bounds: {e}")
+        
+        pooled.browser = browser
+        pooled.use_count = 0
+
+    async def _stop(self, pooled: PooledBrowser):
+        browser, pooled.browser = pooled.browser, None
+        pooled.tab = None
+        pooled.context_id = None
+        if browser is None:
+            return
+        try:
+            await browser.stop()
+        except Exception as e:
+            logger.warning(f"Error stopping browser: {e}")
+
+    async def _open_tab(self, pooled: PooledBrowser):
+        pooled.context_id = await pooled.browser.create_browser_context()
+        pooled.tab = await pooled.browser.new_tab(browser_context_id=pooled.context_id)
+        # Network events carry the main document's response status
+        await pooled.tab.enable_network_events()
+        await pooled.tab.on("Fetch.requestPaused", self._blocked_request_handler(pooled.tab))
+        await pooled.tab.on("Network.requestWillBeSent", self._origin_tracker(pooled))
+        pooled.tab_use_count = 0
+        pooled.resources_blocked = False
+        pooled.origins = set()
+
+    @staticmethod
+    def _origin_tracker(pooled: PooledBrowser):
+        # Every request, redirect hop and iframe load leaves storage behind
+        # under its own origin, so remember them all for the next reset
+        def track_origin(event: dict):
+            origin = url_origin(event["params"]["request"]["url"])
+            if origin:
+                pooled.origins.add(origin)
+        return track_origin
+
+    @staticmethod
+    def _blocked_request_handler(tab):
+        # Only blocked resource types are intercepted (see set_resource_blocking)
+        async def fail_blocked_request(event: dict):
+            try:
+                await tab.execute_command({
+                    "method": "Fetch.failRequest",
+                    "params": {
+                        "requestId": event["params"]["requestId"],
+                        "errorReason": "BlockedByClient"
+                    }
+                })
+            except Exception as e:
+                logger.debug(f"Failed to block request: {e}")
+        return fail_blocked_request
+
+    async def _close_tab(self, pooled: PooledBrowser) -> bool:
+        # Disposing the context closes its tab and drops all of its storage
+        context_id, pooled.context_id = pooled.context_id, None
+        pooled.tab = None
+        if context_id is None or pooled.browser is None:
+            return True
+        try:
+            await pooled.browser.delete_browser_context(context_id)
+            return True
+        except Exception as e:
+            logger.warning(f"Error deleting browser context: {e}")
+            return False
+
+    async def _replace_tab(self, pooled: PooledBrowser):
+        # A browser that cannot dispose a context is most likely gone, so
+        # stop it and let the next checkout relaunch the slot
+        if not await self._close_tab(pooled):
+            await self._stop(pooled)
+
+    async def _reset_tab(self, pooled: PooledBrowser):
+        tab = pooled.tab
+        await tab.go_to("about:blank", timeout=10)
+        await pooled.browser.delete_all_cookies(browser_context_id=pooled.context_id)
+        origins, pooled.origins = pooled.origins, set()
+        await asyncio.gather(*(
+            tab.execute_command({
+                "method": "Storage.clearDataForOrigin",
+                "params": {"origin": origin, "storageTypes": "all"}
+            })
+            for origin in origins
+        ))
+
+    async def start(self):
+        """Pre-start every browser in the pool."""
+        self._slots = [PooledBrowser() for _ in range(self.size)]
+        results = await asyncio.gather(
+            *(self._launch(pooled) for pooled in self._slots),
+            return_exceptions=True
+        )
+        for pooled, result in zip(self._slots, results):
+            if isinstance(result, Exception):
+                # The slot is retried lazily on its next checkout
+                logger.error(f"Failed to start pooled browser: {result}")
+            self._queue.put_nowait(pooled)
+        logger.info(f"Browser pool started with {self.size} browsers")
+
+    async def acquire(self) -> PooledBrowser:
+        """Check out an idle browser, launching it and its tab if needed."""
+        pooled = await self._queue.get()
+        try:
+            if pooled.browser is None:
+                await self._launch(pooled)
+            if pooled.tab is None:
+                await self._open_tab(pooled)
+        except BaseException:
+            # Stop the browser too, so a crashed one is relaunched next time;
+            # the slot is queued again even if the checkout was cancelled
+            try:
+                await self._stop(pooled)
+            finally:
+                self._queue.put_nowait(pooled)
+            raise
+        return pooled
+
+    async def release(self, pooled: PooledBrowser):
+        """
+        Return a browser to the pool, resetting or recycling what is worn out.
+        
+        The cleanup runs in the background so the response is not held back;
+        the slot is queued for the next checkout once it has finished.
+        """
+        pooled.use_count += 1
+        pooled.tab_use_count += 1
+        task = asyncio.create_task(self._recycle(pooled))
+        self._recycle_tasks.add(task)
+        task.add_done_callback(self._recycle_tasks.discard)
+
+    async def _recycle(self, pooled: PooledBrowser):
+        try:
+            if pooled.use_count >= self.recycle_after:
+                logger.info(f"Recycling browser after {pooled.use_count} requests")
+                await self._stop(pooled)
+            elif pooled.tab_use_count >= self.recycle_tab_after:
+                await self._replace_tab(pooled)
+            elif pooled.tab is not None:
+                try:
+                    await self._reset_tab(pooled)
+                except Exception as e:
+                    logger.warning(f"Failed to reset tab, replacing it: {e}")
+                    await self._replace_tab(pooled)
+        finally:
+            self._queue.put_nowait(pooled)
+
+    async def stop(self):
+        """Stop every browser in the pool."""
+        await asyncio.gather(*self._recycle_tasks, return_exceptions=True)
+        await asyncio.gather(*(self._stop(pooled) for pooled in self._slots))
+
+
+# Image encoding used by Chromium for screenshots; webp/jpeg are much smaller than png
+SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+if SCREENSHOT_FORMAT == "jpg":
+    SCREENSHOT_FORMAT = "jpeg"
+if SCREENSHOT_FORMAT not in ("png", "jpeg", "webp"):
+    raise ValueError(f"SCREENSHOT_FORMAT must be png, jpeg or webp, got {SCREENSHOT_FORMAT!r}")
+SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", 70))
+
+# Screenshot bytes written per chunk when streaming scrape responses
+SCREENSHOT_CHUNK_SIZE = 48 * 1024
+
+# Subresource types skipped when only the page content is needed; matched by
+# type rather than URL so versioned and extensionless asset URLs are covered
+BLOCKED_RESOURCE_TYPES = ["Image", "Media", "Font", "Stylesheet"]
+
+# Upper bound (in seconds) on waiting for late network activity after load
+NETWORK_IDLE_TIMEOUT = float(os.getenv("NETWORK_IDLE_TIMEOUT", 6))
+
+# Number of uvicorn worker processes; each one owns a separate browser pool
+WORKERS = int(os.getenv("WORKERS") or 4)
+
+# Browsers per worker when BROWSER_POOL_SIZE is not set explicitly
+MAX_DEFAULT_POOL_SIZE = 4
+
+
+def available_cpus() -> int:
+    """
+    Count the CPUs this process may use.
+    
+    ``os.cpu_count()`` reports the host's cores inside a container, so the
+    cgroup v2 quota and the CPU affinity mask are checked first.
+    """
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, int(quota) // int(period))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# Split the CPUs between workers unless the pool size is set explicitly
+browser_pool = BrowserPool(
+    size=int(
+        os.getenv("BROWSER_POOL_SIZE")
+        or min(MAX_DEFAULT_POOL_SIZE, max(1, available_cpus() // WORKERS))
+    ),
+    recycle_after=int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", 100)),
+    recycle_tab_after=int(os.getenv("BROWSER_POOL_RECYCLE_TAB_AFTER", 50))
+)
+
+
+def preconnect_script(origins: List[str]) -> str:
+    """
+    Build a script adding <link rel="preconnect"> hints for the given origins.
+    
+    It runs as soon as the navigated document is created, so DNS, TCP and TLS
+    for those origins overlap with fetching and parsing the main document.
+    The links are tagged with ``data-pydoll-preconnect`` and removed again on
+    load, so they never show up in the scraped content.
+    """
+    return """
+(() => {
+    if (window !== window.top) return;
+    const origins = %s;
+    window.addEventListener("load", () => {
+        for (const link of document.querySelectorAll("link[data-pydoll-preconnect]")) {
+            link.remove();
+        }
+    });
+    const addHints = () => {
+        for (const origin of origins) {
+            const link = document.createElement("link");
+            link.rel = "preconnect";
+            link.href = origin;
+            link.setAttribute("data-pydoll-preconnect", "");
+            (document.head || document.documentElement).appendChild(link);
+        }
+    };
+    if (document.documentElement) {
+        addHints();
+        return;
+    }
+    new MutationObserver((_, observer) => {
+        if (!document.documentElement) return;
+        observer.disconnect();
+        addHints();
+    }).observe(document, {childList: true});
+})();
+""" % OrjsonCodec.dumps(origins)
+
+
+def scrape_error_result(page_error: str) -> Dict[str, any]:
+    """Build the result returned when a scrape fails."""
+    return {
+        "content": "",
+        "pageStatusCode": None,
+        "pageError": page_error,
+        "screenshot": None
+    }
+
+
+async def set_resource_blocking(pooled: PooledBrowser, block: bool):
+    """
+    Block or allow images, media, fonts and stylesheets on the pooled tab.
+    
+    Requests of the blocked types are paused by the Fetch domain and failed by
+    the tab's ``Fetch.requestPaused`` handler. The interception sticks to the
+    reused tab, so it is only switched on changes.
+    """
+    if block == pooled.resources_blocked:
+        return
+    if block:
+        await pooled.tab.execute_command({
+            "method": "Fetch.enable",
+            "params": {
+                "patterns": [
+                    {"urlPattern": "*", "resourceType": resource_type}
+                    for resource_type in BLOCKED_RESOURCE_TYPES
+                ]
+            }
+        })
+    else:
+        await pooled.tab.execute_command({"method": "Fetch.disable", "params": {}})
+    pooled.resources_blocked = block
+
+
+async def navigate(tab, url: str, timeout: int) -> int:
+    """Navigate to a URL and return the HTTP status of its document."""
+    # The first document response is the navigation itself (redirects
+    # are only reported on the next request), later ones are iframes
+    document_status = None
+    
+    def on_response_received(event: dict):
+        nonlocal document_status
+        params = event["params"]
+        if document_status is None and params.get("type") == "Document":
+            document_status = params["response"]["status"]
+    
+    callback_id = await tab.on("Network.responseReceived", on_response_received)
+    
+    # Navigate to the URL, waiting for the load event up to the request timeout
+    try:
+        await tab.go_to(url, timeout=max(1, timeout // 1000))
+    finally:
+        await tab.remove_callback(callback_id)
+    
+    # Fall back to 200 if the document was served without a network response
+    return document_status or 200
+
+
+# Drops leftover preconnect hints (when load never fired) before serializing the DOM
+PAGE_CONTENT_EXPRESSION = """
+(() => {
+    for (const link of document.querySelectorAll("link[data-pydoll-preconnect]")) {
+        link.remove();
+    }
+    return document.documentElement.outerHTML;
+})()
+"""
+
+
+async def get_page_content(tab) -> str:
+    """Serialize the live DOM of the tab in a single Runtime.evaluate call."""
+    response = await tab.execute_command({
+        "method": "Runtime.evaluate",
+        "params": {
+            "expression": PAGE_CONTENT_EXPRESSION,
+            "returnByValue": True
+        }
+    })
+    result = response["result"]
+    details = result.get("exceptionDetails")
+    if details:
+        message = details.get("exception", {}).get("description") or details.get("text")
+        raise RuntimeError(f"Failed to read page content: {message}")
+    return result["result"]["value"]
+
+
+async def wait_after_navigation(tab, url: str, wait_after_load: int):
+    """Wait the requested time, or until late network activity settles."""
+    # Wait additional time if specified (convert ms to seconds)
+    if wait_after_load > 0:
+        await asyncio.sleep(wait_after_load / 1000)
+        return
+    
+    # Let requests fired after the load event settle instead of
+    # sleeping for a fixed amount of time
+    try:
+        await tab.wait_for_network_idle(timeout=NETWORK_IDLE_TIMEOUT)
+    except WaitTimeout:
+        logger.info(f"Network not idle after {NETWORK_IDLE_TIMEOUT}s for {url}")
+
+
+async def scrape_fast(
+    url: str,
+    wait_after_load: int = 0,
+    timeout: int = 60000
+) -> Dict[str, any]:
+    """
+    Scrape only the page content of a URL.
+    
+    Specialized version of scrape_with_pydoll for the common request that sets
+    no headers, selector, screenshot or warm origins: it navigates, waits and
+    reads the page source without any of the optional per-request setup.
+    
+    Args:
+        url: The URL to scrape
+        wait_after_load: Time to wait after page load (in milliseconds)
+        timeout: Maximum time to wait for page load (in milliseconds)
+    
+    Returns:
+        Dict containing page content, status code and any error
+    """
+    start_time = time.time()
+    pooled = None
+    try:
+        pooled = await browser_pool.acquire()
+        tab = pooled.tab
+        await set_resource_blocking(pooled, True)
+        page_status_code = await navigate(tab, url, timeout)
+        await wait_after_navigation(tab, url, wait_after_load)
+        page_content = await get_page_content(tab)
+        
+        elapsed_time = time.time() - start_time
+        logger.info(f"Successfully scraped {url} in {elapsed_time:.2f}s")
+        
+        return {
+            "content": page_content,
+            "pageStatusCode": page_status_code,
+            "pageError": None,
+            "screenshot": None
+        }
+        
+    except PageLoadTimeout:
+        logger.error(f"Page load timeout for {url}")
+        return scrape_error_result("Page load timeout")
+    except Exception as e:
+        logger.error(f"Error scraping {url}: {e}")
+        return scrape_error_result(str(e))
+    finally:
+        if pooled is not None:
+            await browser_pool.release(pooled)
 
 
 async def scrape_with_pydoll(
@@ -107,7 +636,8 @@ async def scrape_with_pydoll(
     headers: Optional[Dict[str, str]] = None,
     check_selector: Optional[str] = None,
     screenshot: bool = False,
-    full_page_screenshot: bool = False
+    full_page_screenshot: bool = False,
+    warm_origins: Optional[List[str]] = None
 ) -> Dict[str, any]:
     """
     Scrape a URL using pydoll browser automation.
@@ -120,21 +650,20 @@ async def scrape_with_pydoll(
         check_selector: Optional CSS selector to wait for
         screenshot: Whether to capture a screenshot
         full_page_screenshot: Whether to capture a full page screenshot
+        warm_origins: Optional origins the page will load from, preconnected early
     
     Returns:
         Dict containing page content, status code, screenshot data, and any error
     """
     start_time = time.time()
-    page_status_code = None
-    page_error = None
     
-    # Create browser and start it manually (context manager might not be implemented)
-    browser = create_browser()
+    pooled = None
+    preconnect_script_id = None
     try:
-        await browser.start()
-        # Create a new tab and get the page (correct pydoll API)
-        tab = await browser.new_tab()
-        # The tab object itself should have the page methods
+        # Check out a pre-started browser together with its reusable tab,
+        # which runs in its own browser context and is cleared between requests
+        pooled = await browser_pool.acquire()
+        tab = pooled.tab
         
         # Set custom headers if provided
         if headers:
@@ -142,64 +671,56 @@ async def scrape_with_pydoll(
             # This would need to be implemented via request interception
             logger.info(f"Custom headers requested: {headers}")
         
-        # Set browser window bounds for consistent screenshots
-        try:
-            await browser.set_window_bounds({
-                'left': 0,
-                'top': 0,
-                'width': screen_width,
-                'height': screen_height
-            })
-        except Exception as e:
-            logger.warning(f"Failed to set window bounds: {e}")
+        # Without a screenshot nothing is rendered for the caller, so skip
+        # downloading and decoding images, media, fonts and stylesheets
+        await set_resource_blocking(pooled, not (screenshot or full_page_screenshot))
         
-        # Navigate to the URL
-        await tab.go_to(str(url))
+        # Warm up connections to origins the page is known to load from
+        if warm_origins:
+            response = await tab.execute_command({
+                "method": "Page.addScriptToEvaluateOnNewDocument",
+                "params": {"source": preconnect_script(warm_origins)}
+            })
+            preconnect_script_id = response["result"]["identifier"]
         
-        # Try to get the actual HTTP status code from network events
-        # Note: This is a simplified approach - in production you'd want to 
-        # capture the specific response for the main document
-        page_status_code = 200  # Default to 200 for successful navigation
+        page_status_code = await navigate(tab, str(url), timeout)
         
-        # Wait additional time if specified (convert ms to seconds)
-        if wait_after_load > 0:
-            await asyncio.sleep(wait_after_load / 1000)
-        else:
-            # Default wait like in your example
-            await asyncio.sleep(6)
+        # A selector, when given, is the signal that the page is ready
+        if wait_after_load > 0 or not check_selector:
+            await wait_after_navigation(tab, url, wait_after_load)
         
         # Wait for specific selector if provided
         if check_selector:
             try:
-                # pydoll uses find_element for CSS selectors
-                from pydoll.constants import By
-                await tab.find_element(By.CSS_SELECTOR, check_selector, timeout=10)
+                await tab.wait_for_script(
+                    f"document.querySelector({OrjsonCodec.dumps(check_selector)})",
+                    timeout=10
+                )
             except Exception as e:
                 logger.warning(f"Failed to find selector {check_selector}: {e}")
                 # Don't fail the whole request for selector issues
         
         # Get page content
-        page_content = await tab.page_source
+        page_content = await get_page_content(tab)
         
         # Capture screenshot if requested
         screenshot_data = None
         if screenshot or full_page_screenshot:
             try:
-                # Create a temporary file path for screenshot
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                    screenshot_path = tmp_file.name
-                
-                # Use pydoll's correct screenshot method
-                await tab.take_screenshot(path=screenshot_path)
-                
-                # Read the screenshot file and convert to base64
-                with open(screenshot_path, 'rb') as img_file:
-                    screenshot_bytes = img_file.read()
-                    screenshot_data = base64.b64encode(screenshot_bytes).decode('utf-8')
-                
-                # Clean up the temporary file
-                os.unlink(screenshot_path)
+                # CDP already returns the image base64-encoded, so use it as-is
+                # instead of round-tripping through a temporary file
+                params = {
+                    "format": SCREENSHOT_FORMAT,
+                    "captureBeyondViewport": full_page_screenshot
+                }
+                if SCREENSHOT_FORMAT != "png":
+                    # Lossy formats are encoded by Chromium itself, no re-encode needed
+                    params["quality"] = SCREENSHOT_QUALITY
+                result = await tab.execute_command({
+                    "method": "Page.captureScreenshot",
+                    "params": params
+                })
+                screenshot_data = result["result"]["data"]
                 
                 logger.info(f"Screenshot captured for {url}")
                 
@@ -214,34 +735,75 @@ async def scrape_with_pydoll(
         return {
             "content": page_content,
             "pageStatusCode": page_status_code,
-            "pageError": page_error,
-            "screenshot": screenshot_data
+            "pageError": None,
+            "screenshot": screenshot_data,
+            "screenshotFormat": SCREENSHOT_FORMAT if screenshot_data else None
         }
         
     except PageLoadTimeout:
-        page_error = "Page load timeout"
         logger.error(f"Page load timeout for {url}")
-        return {
-            "content": "",
-            "pageStatusCode": None,
-            "pageError": page_error,
-            "screenshot": None
-        }
+        return scrape_error_result("Page load timeout")
     except Exception as e:
-        page_error = str(e)
         logger.error(f"Error scraping {url}: {e}")
-        return {
-            "content": "",
-            "pageStatusCode": None,
-            "pageError": page_error,
-            "screenshot": None
-        }
+        return scrape_error_result(str(e))
     finally:
-        # Clean up browser
-        try:
-            await browser.stop()
-        except Exception as e:
-            logger.warning(f"Error stopping browser: {e}")
+        # Drop the per-request script and hand the browser back to the pool
+        if preconnect_script_id is not None:
+            try:
+                await tab.execute_command({
+                    "method": "Page.removeScriptToEvaluateOnNewDocument",
+                    "params": {"identifier": preconnect_script_id}
+                })
+            except Exception as e:
+                # Replace the tab so the script does not run on later scrapes
+                logger.warning(f"Error removing preconnect script, replacing tab: {e}")
+                pooled.tab_use_count = browser_pool.recycle_tab_after
+        if pooled is not None:
+            await browser_pool.release(pooled)
+
+
+def stream_scrape_response(result: Dict[str, any]):
+    """
+    Yield the JSON body of a scrape result with the screenshot sent in chunks.
+
+    The base64 screenshot is the bulk of the payload, so it is spliced into the
+    serialized envelope piece by piece instead of being copied into one large
+    response body. Base64 contains no characters that need JSON escaping.
+    """
+    screenshot_data = result["screenshot"]
+    envelope = OrjsonCodec.dumps(
+        {k: v for k, v in result.items() if k != "screenshot"}
+    ).encode("utf-8")
+    yield envelope[:-1] + b',"screenshot":"'
+    for i in range(0, len(screenshot_data), SCREENSHOT_CHUNK_SIZE):
+        yield screenshot_data[i:i + SCREENSHOT_CHUNK_SIZE].encode("ascii")
+    yield b'"}'
+
+
+async def run_scrape_request(request: ScrapeRequest) -> Dict[str, any]:
+    """Run the scrape for an API request, taking the fast path when possible."""
+    if not (
+        request.headers
+        or request.check_selector
+        or request.screenshot
+        or request.full_page_screenshot
+        or request.warm_origins
+    ):
+        return await scrape_fast(
+            url=str(request.url),
+            wait_after_load=request.wait_after_load or 0,
+            timeout=request.timeout or 60000
+        )
+    return await scrape_with_pydoll(
+        url=str(request.url),
+        wait_after_load=request.wait_after_load or 0,
+        timeout=request.timeout or 60000,
+        headers=request.headers,
+        check_selector=request.check_selector,
+        screenshot=request.screenshot or False,
+        full_page_screenshot=request.full_page_screenshot or False,
+        warm_origins=[str(origin) for origin in request.warm_origins or []]
+    )
 
 
 @app.post("/scrape", response_model=ScrapeResponse)
@@ -250,16 +812,13 @@ async def scrape_endpoint(request: ScrapeRequest):
     Main scraping endpoint that matches the original Playwright service API.
     """
     try:
-        result = await scrape_with_pydoll(
-            url=str(request.url),
-            wait_after_load=request.wait_after_load or 0,
-            timeout=request.timeout or 60000,
-            headers=request.headers,
-            check_selector=request.check_selector,
-            screenshot=request.screenshot or False,
-            full_page_screenshot=request.full_page_screenshot or False
-        )
+        result = await run_scrape_request(request)
         
+        if result["screenshot"]:
+            return StreamingResponse(
+                stream_scrape_response(result),
+                media_type="application/json"
+            )
         return ScrapeResponse(**result)
         
     except Exception as e:
@@ -267,6 +826,34 @@ async def scrape_endpoint(request: ScrapeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/scrape_batch", response_model=BatchScrapeResponse)
+async def scrape_batch_endpoint(batch: BatchScrapeRequest):
+    """
+    Scrape several URLs in one call, in parallel across the browser pool.
+    
+    Results are returned in the same order as the requested items.
+    """
+    semaphore = asyncio.Semaphore(browser_pool.size)
+    
+    async def scrape_one(request: ScrapeRequest):
+        async with semaphore:
+            return await run_scrape_request(request)
+    
+    results = await asyncio.gather(
+        *(scrape_one(request) for request in batch.items),
+        return_exceptions=True
+    )
+    
+    responses = []
+    for request, result in zip(batch.items, results):
+        if isinstance(result, Exception):
+            logger.error(f"Batch item error for {request.url}: {result}")
+            responses.append(ScrapeResponse(content="", pageError=str(result)))
+        else:
+            responses.append(ScrapeResponse(**result))
+    return BatchScrapeResponse(results=responses)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -275,15 +862,19 @@ async def health_check():
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize browser on startup."""
+    """Initialize virtual display and browser pool on startup."""
     logger.info("Starting pydoll scraping service...")
-    # Browser will be initialized on first request
+    await asyncio.to_thread(start_virtual_display)
+    await browser_pool.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Cleanup virtual display on shutdown."""
+    """Cleanup browser pool and virtual display on shutdown."""
     logger.info("Shutting down pydoll scraping service...")
+    await browser_pool.stop()
+    if virtual_display is None:
+        return
     try:
         virtual_display.stop()
         logger.info("Virtual display stopped")
@@ -295,4 +886,5 @@ if __name__ == "__main__":
     import uvicorn
     
     port = int(os.getenv("PORT", 3003))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    # Each worker imports the app and starts its own browser pool on startup
+    uvicorn.run("app:app", host="0.0.0.0", port=port, workers=WORKERS)
\ No newline at end of file
@@ -7,6 +7,17 @@ import asyncio
 import json
 import aiohttp
 
+# Shared across tests so connections are reused instead of re-established
+SESSION: aiohttp.ClientSession | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared client session, creating it on first use."""
+    global SESSION
+    if SESSION is None or SESSION.closed:
+        SESSION = aiohttp.ClientSession()
+    return SESSION
+
 
 async def test_pydoll_service():
     """Test the pydoll service endpoint."""
@@ -19,22 +30,22 @@ async def test_pydoll_service():
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                test_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print("✅ Test successful!")
-                    print(f"Content length: {len(data.get('content', ''))}")
-                    print(f"Status code: {data.get('pageStatusCode')}")
-                    print(f"Error: {data.get('pageError')}")
-                else:
-                    print(f"❌ Test failed with status {response.status}")
-                    text = await response.text()
-                    print(f"Response: {text}")
+        session = await get_session()
+        async with session.post(
+            test_url,
+            json=payload,
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                print("✅ Test successful!")
+                print(f"Content length: {len(data.get('content', ''))}")
+                print(f"Status code: {data.get('pageStatusCode')}")
+                print(f"Error: {data.get('pageError')}")
+            else:
+                print(f"❌ Test failed with status {response.status}")
+                text = await response.text()
+                print(f"Response: {text}")
                     
     except Exception as e:
         print(f"❌ Test failed with exception: {e}")
@@ -45,14 +56,14 @@ async def test_health_endpoint():
     test_url = "http://localhost:3003/health"
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(test_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print("✅ Health check successful!")
-                    print(f"Response: {data}")
-                else:
-                    print(f"❌ Health check failed with status {response.status}")
+        session = await get_session()
+        async with session.get(test_url) as response:
+            if response.status == 200:
+                data = await response.json()
+                print("✅ Health check successful!")
+                print(f"Response: {data}")
+            else:
+                print(f"❌ Health check failed with status {response.status}")
                     
     except Exception as e:
         print(f"❌ Health check failed with exception: {e}")
@@ -60,8 +71,12 @@ async def test_health_endpoint():
 
 async def main():
     print("Testing pydoll service...")
-    await test_health_endpoint()
-    await test_pydoll_service()
+    try:
+        await test_health_endpoint()
+        await test_pydoll_service()
+    finally:
+        if SESSION is not None:
+            await SESSION.close()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Test script to verify screenshot functionality in the pydoll service.
 
 import asyncio
 import json
-import requests
+import aiohttp
 import base64
 import os
 
@@ -32,52 +32,53 @@ async def test_pydoll_service_screenshot():
     print(f"Request data: {json.dumps(test_data, indent=2)}")
     
     try:
-        response = requests.post(
-            endpoint,
-            json=test_data,
-            headers={"Content-Type": "application/json"},
-            timeout=60
-        )
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                endpoint,
+                json=test_data,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                print(f"Status Code: {response.status}")
         
-        print(f"Status Code: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print("✅ Request successful!")
-            print(f"Content length: {len(result.get('content', ''))}")
-            print(f"Page status: {result.get('pageStatusCode')}")
-            print(f"Page error: {result.get('pageError')}")
+                if response.status == 200:
+                    result = await response.json()
+                    print("✅ Request successful!")
+                    print(f"Content length: {len(result.get('content', ''))}")
+                    print(f"Page status: {result.get('pageStatusCode')}")
+                    print(f"Page error: {result.get('pageError')}")
             
-            screenshot_data = result.get('screenshot')
-            if screenshot_data:
-                print(f"✅ Screenshot captured! Length: {len(screenshot_data)}")
+                    screenshot_data = result.get('screenshot')
+                    if screenshot_data:
+                        print(f"✅ Screenshot captured! Length: {len(screenshot_data)}")
                 
-                # Try to save the screenshot to verify it's valid
-                try:
-                    # Remove data URL prefix if present
-                    if screenshot_data.startswith('data:image'):
-                        screenshot_data = screenshot_data.split(',')[1]
+                        # Try to save the screenshot to verify it's valid
+                        try:
+                            # Remove data URL prefix if present
+                            if screenshot_data.startswith('data:image'):
+                                screenshot_data = screenshot_data.split(',')[1]
                     
-                    # Decode base64
-                    image_data = base64.b64decode(screenshot_data)
+                            # Decode base64
+                            image_data = base64.b64decode(screenshot_data)
                     
-                    # Save to file
-                    with open('test_screenshot.png', 'wb') as f:
-                        f.write(image_data)
+                            # Save to file, named after the format the service encoded
+                            screenshot_file = f"test_screenshot.{result.get('screenshotFormat') or 'png'}"
+                            with open(screenshot_file, 'wb') as f:
+                                f.write(image_data)
                     
-                    print("✅ Screenshot saved as test_screenshot.png")
-                    print(f"Screenshot file size: {len(image_data)} bytes")
+                            print(f"✅ Screenshot saved as {screenshot_file}")
+                            print(f"Screenshot file size: {len(image_data)} bytes")
                     
-                except Exception as e:
-                    print(f"❌ Error processing screenshot: {e}")
-            else:
-                print("❌ No screenshot data returned")
+                        except Exception as e:
+                            print(f"❌ Error processing screenshot: {e}")
+                    else:
+                        print("❌ No screenshot data returned")
                 
-        else:
-            print(f"❌ Request failed with status {response.status_code}")
-            print(f"Response: {response.text}")
+                else:
+                    print(f"❌ Request failed with status {response.status}")
+                    print(f"Response: {await response.text()}")
             
-    except requests.exceptions.ConnectionError:
+    except aiohttp.ClientConnectionError:
         print("❌ Connection failed - is the pydoll service running?")
     except Exception as e:
         print(f"❌ Error: {e}")